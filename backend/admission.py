@@ -0,0 +1,179 @@
+"""
+Admission control for the Smart Fridge API.
+Applies per-user token-bucket rate limits per route class and a bounded
+concurrency limit for expensive endpoints (PDF rendering). Rejected requests
+are answered immediately with 429/503 and a Retry-After header.
+"""
+
+import math
+import threading
+import time
+from collections import OrderedDict
+from flask import Blueprint, request, jsonify, g
+from database import get_user_id_by_username
+
+# Route classes: (bucket capacity, refill rate in tokens per second)
+RATE_LIMITS = {
+    'write': (30, 1.0),
+    'pdf': (5, 0.1),
+}
+
+# Each remote address gets this many times the per-user budget, so that
+# rotating the claimed user id does not bypass the limit
+ADDRESS_LIMIT_FACTOR = 5
+
+# Upper bound on tracked buckets; idle buckets are pruned every PRUNE_INTERVAL seconds
+MAX_BUCKETS = 10000
+PRUNE_INTERVAL = 60
+
+# Maximum number of PDF renderings running at the same time
+PDF_CONCURRENCY = 2
+PDF_RETRY_AFTER = 2
+
+# Endpoints that render PDFs
+PDF_ENDPOINTS = {'fridge_bp.generate_shopping_list_pdf'}
+
+WRITE_METHODS = {'POST', 'PUT', 'DELETE'}
+
+admission_bp = Blueprint('admission_bp', __name__, url_prefix='/admission')
+
+
+class TokenBucket:
+    def __init__(self, capacity, rate):
+        self.capacity = capacity
+        self.rate = rate
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    def refill(self, now):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self, now):
+        """Seconds until a token is available, 0 if one is available now."""
+        self.refill(now)
+        if self.tokens >= 1:
+            return 0
+        return (1 - self.tokens) / self.rate
+
+    def is_idle(self, now):
+        # Unused long enough to be full again, i.e. equivalent to a fresh bucket
+        return self.tokens + (now - self.updated) * self.rate >= self.capacity
+
+
+_lock = threading.Lock()
+_buckets = OrderedDict()
+_last_prune = time.monotonic()
+_pdf_slots = threading.BoundedSemaphore(PDF_CONCURRENCY)
+_counters = {
+    route_class: {"admitted": 0, "rate_limited": 0, "overloaded": 0}
+    for route_class in RATE_LIMITS
+}
+
+
+def classify_request():
+    if request.endpoint in PDF_ENDPOINTS:
+        return 'pdf'
+    if request.method in WRITE_METHODS and request.blueprint != admission_bp.name:
+        return 'write'
+    return None
+
+
+def client_keys():
+    """Identify the caller: always the remote address, plus the user claimed in the URL or JSON body."""
+    keys = [(f"addr:{request.remote_addr}", ADDRESS_LIMIT_FACTOR)]
+    view_args = request.view_args or {}
+    data = request.get_json(silent=True)
+    if 'user_id' in view_args:
+        keys.append((f"user:{view_args['user_id']}", 1))
+    elif 'username' in view_args:
+        # Same budget as requests that name the user by id
+        user_id = get_user_id_by_username(view_args['username'])
+        if user_id is not None:
+            keys.append((f"user:{user_id}", 1))
+        else:
+            keys.append((f"username:{view_args['username']}", 1))
+    elif isinstance(data, dict) and data.get('user_id') is not None:
+        keys.append((f"user:{data['user_id']}", 1))
+    return keys
+
+
+def _prune_buckets(now):
+    global _last_prune
+    if now - _last_prune >= PRUNE_INTERVAL:
+        for key in [key for key, bucket in _buckets.items() if bucket.is_idle(now)]:
+            del _buckets[key]
+        _last_prune = now
+    # Over the cap: drop the least recently used buckets
+    while len(_buckets) > MAX_BUCKETS:
+        _buckets.popitem(last=False)
+
+
+def _get_bucket(route_class, key, factor):
+    bucket = _buckets.get((route_class, key))
+    if bucket is None:
+        capacity, rate = RATE_LIMITS[route_class]
+        bucket = _buckets[(route_class, key)] = TokenBucket(capacity * factor, rate * factor)
+    else:
+        _buckets.move_to_end((route_class, key))
+    return bucket
+
+
+def _reject(status, message, retry_after):
+    response = jsonify({"error": message})
+    response.status_code = status
+    response.headers['Retry-After'] = str(max(1, math.ceil(retry_after)))
+    return response
+
+
+def admit_request():
+    route_class = classify_request()
+    if route_class is None:
+        return None
+
+    # Take the PDF slot first, so a 503 does not also cost a rate-limit token
+    if route_class == 'pdf':
+        if not _pdf_slots.acquire(blocking=False):
+            with _lock:
+                _counters[route_class]["overloaded"] += 1
+            return _reject(503, "Server busy, please retry later.", PDF_RETRY_AFTER)
+        g.admission_slot = True
+
+    keys = client_keys()
+    with _lock:
+        now = time.monotonic()
+        buckets = [_get_bucket(route_class, key, factor) for key, factor in keys]
+        # Only consume when every bucket has a token available
+        wait = max(bucket.wait_time(now) for bucket in buckets)
+        if wait:
+            _counters[route_class]["rate_limited"] += 1
+        else:
+            for bucket in buckets:
+                bucket.tokens -= 1
+        _prune_buckets(now)
+    if wait:
+        release_slot()
+        return _reject(429, "Too many requests.", wait)
+
+    with _lock:
+        _counters[route_class]["admitted"] += 1
+    return None
+
+
+def release_slot(exc=None):
+    if g.pop('admission_slot', False):
+        _pdf_slots.release()
+
+
+@admission_bp.route('/stats', methods=['GET'])
+def get_admission_stats():
+    with _lock:
+        stats = {route_class: dict(counts) for route_class, counts in _counters.items()}
+    return jsonify(stats), 200
+
+
+def init_admission(app):
+    """Register admission control hooks and the stats endpoint on the app."""
+    app.before_request(admit_request)
+    app.teardown_request(release_slot)
+    app.register_blueprint(admission_bp)
@@ -61,6 +61,33 @@ def initialize_database():
         );
     ''')
 
+    # Für Abfragen je Kühlschrank bzw. Produkt und das nächste Ablaufdatum
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_in_fridge_fridge ON in_fridge(fridge_id, haltbarkeit)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_in_fridge_product ON in_fridge(product_id)')
+    # Für Abfragen je Benutzer und das stapelweise Löschen von Konten
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_fridge_user ON fridge(user_id)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_product_user ON product(user_id)')
+
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS deletion_job (
+            job_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            entity_type TEXT NOT NULL,
+            entity_id INTEGER NOT NULL,
+            status TEXT NOT NULL DEFAULT 'pending',
+            deleted_rows INTEGER NOT NULL DEFAULT 0,
+            created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            finished_at TEXT
+        );
+    ''')
+
+    # Offene Aufträge werden bei jeder Kühlschrank- und Benutzerabfrage geprüft
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_deletion_job_pending
+        ON deletion_job(entity_type, entity_id) WHERE status = 'pending'
+    ''')
+
+    create_fridge_summary(cursor)
+
     # Beispiel-Daten einfügen, wenn Tabellen leer sind
     cursor.execute('SELECT COUNT(*) FROM user')
     if cursor.fetchone()[0] == 0:
@@ -99,6 +126,214 @@ def initialize_database():
     conn.commit()
     conn.close()
 
+    # Bestehende Datenbanken ohne Zusammenfassung nachziehen
+    stale = check_fridge_summary()
+    if stale:
+        print(f"[initialize_database] Zusammenfassung neu aufgebaut für Kühlschränke: {stale}")
+
+def _tombstoned_sql(entity_type, id_expr):
+    # Wahr, solange für die Entität ein Löschauftrag offen ist
+    return f'''EXISTS (
+        SELECT 1 FROM deletion_job
+        WHERE entity_type = '{entity_type}' AND entity_id = {id_expr} AND status = 'pending'
+    )'''
+
+def _fridge_hidden_sql(fridge_alias):
+    # Kühlschränke sind verborgen, wenn sie selbst oder ihr Besitzer gelöscht werden
+    return (f"({_tombstoned_sql('fridge', f'{fridge_alias}.fridge_id')}"
+            f" OR {_tombstoned_sql('user', f'{fridge_alias}.user_id')})")
+
+def _user_active_sql(id_expr):
+    # Wahr, wenn der Benutzer existiert und nicht gelöscht wird
+    return f'''EXISTS (
+        SELECT 1 FROM user u WHERE u.user_id = {id_expr} AND NOT {_tombstoned_sql('user', 'u.user_id')}
+    )'''
+
+def _fridge_visible_sql(id_expr):
+    # Wahr, wenn der Kühlschrank existiert und nicht gelöscht wird
+    return f'''EXISTS (
+        SELECT 1 FROM fridge fr WHERE fr.fridge_id = {id_expr} AND NOT {_fridge_hidden_sql('fr')}
+    )'''
+
+def _refresh_fridge_summary_statements(fridge_filter):
+    # Berechnet die Zusammenfassung für alle Kühlschränke neu, die fridge_filter erfüllen
+    return [
+        f'''
+            INSERT OR REPLACE INTO fridge_summary (fridge_id, item_count, total_menge, next_expiry)
+            SELECT fr.fridge_id, COUNT(f.id), COALESCE(SUM(f.menge), 0), MIN(NULLIF(f.haltbarkeit, ''))
+            FROM fridge fr
+            LEFT JOIN in_fridge f ON f.fridge_id = fr.fridge_id
+            WHERE fr.fridge_id {fridge_filter}
+            GROUP BY fr.fridge_id''',
+        f'''
+            DELETE FROM fridge_summary_stock WHERE fridge_id {fridge_filter}''',
+        f'''
+            INSERT INTO fridge_summary_stock (fridge_id, kategorie, einheit, item_count, total_menge)
+            SELECT f.fridge_id, COALESCE(p.kategorie, ''), COALESCE(p.einheit, ''), COUNT(*), SUM(f.menge)
+            FROM in_fridge f
+            JOIN product p ON f.product_id = p.product_id
+            JOIN fridge fr ON f.fridge_id = fr.fridge_id
+            WHERE f.fridge_id {fridge_filter}
+            GROUP BY f.fridge_id, COALESCE(p.kategorie, ''), COALESCE(p.einheit, '')''',
+    ]
+
+def _refresh_fridge_summary_sql(fridge_filter):
+    return ''.join(statement + ';' for statement in _refresh_fridge_summary_statements(fridge_filter))
+
+def _add_item_to_summary_sql(row):
+    # Zählt den Eintrag row (NEW) zur Zusammenfassung seines Kühlschranks hinzu
+    return f'''
+            UPDATE fridge_summary
+            SET item_count = item_count + 1,
+                total_menge = total_menge + {row}.menge,
+                next_expiry = (SELECT MIN(haltbarkeit) FROM in_fridge
+                               WHERE fridge_id = {row}.fridge_id AND haltbarkeit > '')
+            WHERE fridge_id = {row}.fridge_id;
+
+            INSERT INTO fridge_summary_stock (fridge_id, kategorie, einheit, item_count, total_menge)
+            SELECT {row}.fridge_id, COALESCE(p.kategorie, ''), COALESCE(p.einheit, ''), 1, {row}.menge
+            FROM product p WHERE p.product_id = {row}.product_id
+            ON CONFLICT(fridge_id, kategorie, einheit) DO UPDATE
+            SET item_count = item_count + 1, total_menge = total_menge + excluded.total_menge;
+    '''
+
+def _remove_item_from_summary_sql(row):
+    # Zieht den Eintrag row (OLD) von der Zusammenfassung seines Kühlschranks ab.
+    # Wurde das Produkt gelöscht (Kaskade), hat fridge_summary_product_delete den
+    # Bestand bereits verrechnet; die Bestandszeile wird dann nicht gefunden.
+    return f'''
+            UPDATE fridge_summary
+            SET item_count = item_count - 1,
+                total_menge = CASE WHEN item_count = 1 THEN 0 ELSE total_menge - {row}.menge END,
+                next_expiry = (SELECT MIN(haltbarkeit) FROM in_fridge
+                               WHERE fridge_id = {row}.fridge_id AND haltbarkeit > '')
+            WHERE fridge_id = {row}.fridge_id;
+
+            UPDATE fridge_summary_stock
+            SET item_count = item_count - 1, total_menge = total_menge - {row}.menge
+            WHERE fridge_id = {row}.fridge_id
+              AND (kategorie, einheit) = (SELECT COALESCE(kategorie, ''), COALESCE(einheit, '')
+                                          FROM product WHERE product_id = {row}.product_id);
+
+            DELETE FROM fridge_summary_stock WHERE fridge_id = {row}.fridge_id AND item_count <= 0;
+    '''
+
+def _remove_product_from_stock_sql():
+    # Zieht alle Einträge des gelöschten Produkts OLD einmal je Kühlschrank ab
+    product_fridges = 'SELECT fridge_id FROM in_fridge WHERE product_id = OLD.product_id'
+    return f'''
+            UPDATE fridge_summary_stock
+            SET item_count = item_count - (
+                    SELECT COUNT(*) FROM in_fridge f
+                    WHERE f.product_id = OLD.product_id AND f.fridge_id = fridge_summary_stock.fridge_id),
+                total_menge = total_menge - (
+                    SELECT SUM(f.menge) FROM in_fridge f
+                    WHERE f.product_id = OLD.product_id AND f.fridge_id = fridge_summary_stock.fridge_id)
+            WHERE kategorie = COALESCE(OLD.kategorie, '') AND einheit = COALESCE(OLD.einheit, '')
+              AND fridge_id IN ({product_fridges});
+
+            DELETE FROM fridge_summary_stock
+            WHERE item_count <= 0 AND fridge_id IN ({product_fridges});
+    '''
+
+def create_fridge_summary(cursor):
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS fridge_summary (
+            fridge_id INTEGER PRIMARY KEY,
+            item_count INTEGER NOT NULL DEFAULT 0,
+            total_menge REAL NOT NULL DEFAULT 0,
+            next_expiry TEXT,
+            FOREIGN KEY(fridge_id) REFERENCES fridge(fridge_id) ON DELETE CASCADE
+        );
+    ''')
+
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS fridge_summary_stock (
+            fridge_id INTEGER NOT NULL,
+            kategorie TEXT NOT NULL,
+            einheit TEXT NOT NULL,
+            item_count INTEGER NOT NULL,
+            total_menge REAL NOT NULL,
+            PRIMARY KEY(fridge_id, kategorie, einheit),
+            FOREIGN KEY(fridge_id) REFERENCES fridge(fridge_id) ON DELETE CASCADE
+        );
+    ''')
+
+    # Beim stapelweisen Löschen eines Kühlschranks wird die Zusammenfassung nicht
+    # nach jeder Zeile neu berechnet; sie verschwindet mit dem Kühlschrank selbst.
+    item_delete_event = f'''AFTER DELETE ON in_fridge
+            WHEN NOT EXISTS (
+                SELECT 1 FROM fridge fr WHERE fr.fridge_id = OLD.fridge_id AND {_fridge_hidden_sql('fr')}
+            )'''
+
+    # Einträge werden inkrementell verrechnet; nur Produktänderungen berechnen
+    # die betroffenen Kühlschränke neu.
+    triggers = {
+        'fridge_summary_fridge_insert': ('AFTER INSERT ON fridge',
+                                         _refresh_fridge_summary_sql('= NEW.fridge_id')),
+        'fridge_summary_item_insert': ('AFTER INSERT ON in_fridge',
+                                       _add_item_to_summary_sql('NEW')),
+        'fridge_summary_item_delete': (item_delete_event,
+                                       _remove_item_from_summary_sql('OLD')),
+        'fridge_summary_item_update': ('AFTER UPDATE ON in_fridge',
+                                       _remove_item_from_summary_sql('OLD') + _add_item_to_summary_sql('NEW')),
+        'fridge_summary_product_delete': ('BEFORE DELETE ON product',
+                                          _remove_product_from_stock_sql()),
+        'fridge_summary_product_update': ('AFTER UPDATE OF kategorie, einheit ON product',
+                                          _refresh_fridge_summary_sql(
+                                              'IN (SELECT fridge_id FROM in_fridge WHERE product_id = NEW.product_id)')),
+    }
+    for name, (event, body) in triggers.items():
+        # Neu anlegen, damit geänderte Definitionen auch bestehende Datenbanken erreichen
+        cursor.execute(f'DROP TRIGGER IF EXISTS {name}')
+        cursor.execute(f'''
+            CREATE TRIGGER {name} {event}
+            BEGIN
+                {body}
+            END;
+        ''')
+
+def _rounded(rows, menge_index):
+    return {row[:menge_index] + (round(row[menge_index], 6),) + row[menge_index + 1:] for row in rows}
+
+def check_fridge_summary():
+    """Rebuild the fridge summary from scratch and return the ids of fridges whose stored summary was stale."""
+    try:
+        conn = create_connection()
+        # Vergleich und Neuaufbau in einer Transaktion, damit parallele Schreibzugriffe
+        # nicht als Abweichung erscheinen
+        conn.isolation_level = None
+        cursor = conn.cursor()
+        cursor.execute('BEGIN IMMEDIATE')
+        cursor.execute('SELECT * FROM fridge_summary ORDER BY fridge_id')
+        stored = cursor.fetchall()
+        cursor.execute('SELECT * FROM fridge_summary_stock ORDER BY fridge_id, kategorie, einheit')
+        stored_stock = cursor.fetchall()
+
+        cursor.execute('DELETE FROM fridge_summary')
+        for statement in _refresh_fridge_summary_statements('IS NOT NULL'):
+            cursor.execute(statement)
+
+        cursor.execute('SELECT * FROM fridge_summary ORDER BY fridge_id')
+        rebuilt = cursor.fetchall()
+        cursor.execute('SELECT * FROM fridge_summary_stock ORDER BY fridge_id, kategorie, einheit')
+        rebuilt_stock = cursor.fetchall()
+
+        # Gelöscht werdende Kühlschränke werden absichtlich nicht mehr nachgeführt
+        cursor.execute(f'SELECT fridge_id FROM fridge fr WHERE {_fridge_hidden_sql("fr")}')
+        hidden = {row[0] for row in cursor.fetchall()}
+        cursor.execute('COMMIT')
+
+        # Mengen werden inkrementell summiert; Rundungsfehler nicht als Abweichung werten
+        stale = {row[0] for row in _rounded(stored, 2) ^ _rounded(rebuilt, 2)}
+        stale |= {row[0] for row in _rounded(stored_stock, 4) ^ _rounded(rebuilt_stock, 4)}
+        return sorted(stale - hidden)
+    except Error as e:
+        print(f"[check_fridge_summary] Fehler: {e}")
+        return None
+    finally:
+        conn.close()
+
 def add_user(username, email, password):
     try:
         conn = create_connection()
@@ -119,7 +354,9 @@ def get_user_by_credentials(email, password):
     try:
         conn = create_connection()
         cursor = conn.cursor()
-        cursor.execute('SELECT * FROM user WHERE email = ?', (email,))
+        cursor.execute(f'''
+            SELECT * FROM user u WHERE email = ? AND NOT {_tombstoned_sql('user', 'u.user_id')}
+        ''', (email,))
         user = cursor.fetchone()
         
         if user and check_password_hash(user[3], password):  # user[3] is password_hash
@@ -134,16 +371,30 @@ def get_user_by_credentials(email, password):
 def get_user_by_id(user_id):
     conn = create_connection()
     cursor = conn.cursor()
-    cursor.execute('SELECT * FROM user WHERE user_id = ?', (user_id,))
+    cursor.execute(f'''
+        SELECT * FROM user u WHERE user_id = ? AND NOT {_tombstoned_sql('user', 'u.user_id')}
+    ''', (user_id,))
     user = cursor.fetchone()
     conn.close()
     return user
 
+def get_user_id_by_username(username):
+    conn = create_connection()
+    cursor = conn.cursor()
+    cursor.execute('SELECT user_id FROM user WHERE username = ?', (username,))
+    row = cursor.fetchone()
+    conn.close()
+    return row[0] if row else None
+
 def add_fridge(user_id, title):
     try:
         conn = create_connection()
         cursor = conn.cursor()
-        cursor.execute('INSERT INTO fridge (user_id, title) VALUES (?, ?)', (user_id, title))
+        cursor.execute(f'''
+            INSERT INTO fridge (user_id, title) SELECT ?, ? WHERE {_user_active_sql('?')}
+        ''', (user_id, title, user_id))
+        if cursor.rowcount == 0:
+            return False
         conn.commit()
         return True
     except Error as e:
@@ -155,15 +406,40 @@ def add_fridge(user_id, title):
 def get_fridges_by_user(user_id):
     conn = create_connection()
     cursor = conn.cursor()
-    cursor.execute('SELECT * FROM fridge WHERE user_id = ?', (user_id,))
+    cursor.execute(f'''
+        SELECT * FROM fridge fr WHERE user_id = ? AND NOT {_fridge_hidden_sql('fr')}
+    ''', (user_id,))
     fridges = cursor.fetchall()
     conn.close()
     return fridges
 
+def get_fridge_summaries_by_user(user_id):
+    conn = create_connection()
+    cursor = conn.cursor()
+    cursor.execute(f'''
+        SELECT fr.fridge_id, fr.user_id, fr.title,
+               COALESCE(s.item_count, 0), COALESCE(s.total_menge, 0), s.next_expiry
+        FROM fridge fr
+        LEFT JOIN fridge_summary s ON s.fridge_id = fr.fridge_id
+        WHERE fr.user_id = ? AND NOT {_fridge_hidden_sql('fr')}
+    ''', (user_id,))
+    fridges = cursor.fetchall()
+    cursor.execute(f'''
+        SELECT st.fridge_id, st.kategorie, st.einheit, st.item_count, st.total_menge
+        FROM fridge_summary_stock st
+        JOIN fridge fr ON st.fridge_id = fr.fridge_id
+        WHERE fr.user_id = ? AND NOT {_fridge_hidden_sql('fr')}
+    ''', (user_id,))
+    stock = cursor.fetchall()
+    conn.close()
+    return fridges, stock
+
 def get_fridge_by_id(fridge_id):
     conn = create_connection()
     cursor = conn.cursor()
-    cursor.execute('SELECT * FROM fridge WHERE fridge_id = ?', (fridge_id,))
+    cursor.execute(f'''
+        SELECT * FROM fridge fr WHERE fridge_id = ? AND NOT {_fridge_hidden_sql('fr')}
+    ''', (fridge_id,))
     fridge = cursor.fetchone()
     conn.close()
     return fridge
@@ -172,7 +448,9 @@ def update_fridge(fridge_id, title):
     try:
         conn = create_connection()
         cursor = conn.cursor()
-        cursor.execute('UPDATE fridge SET title = ? WHERE fridge_id = ?', (title, fridge_id))
+        cursor.execute(f'''
+            UPDATE fridge SET title = ? WHERE fridge_id = ? AND NOT {_fridge_hidden_sql('fridge')}
+        ''', (title, fridge_id))
         if cursor.rowcount == 0:
             return False
         conn.commit()
@@ -184,28 +462,156 @@ def update_fridge(fridge_id, title):
         conn.close()
 
 def delete_fridge(fridge_id):
+    """Tombstone the fridge and queue its removal. Returns the deletion job id, or None."""
+    try:
+        conn = create_connection()
+        cursor = conn.cursor()
+        cursor.execute(f'''
+            INSERT INTO deletion_job (entity_type, entity_id)
+            SELECT 'fridge', fridge_id FROM fridge fr
+            WHERE fridge_id = ? AND NOT {_fridge_hidden_sql('fr')}
+        ''', (fridge_id,))
+        if cursor.rowcount == 0:
+            return None
+        conn.commit()
+        return cursor.lastrowid
+    except Error as e:
+        print(f"[delete_fridge] Fehler: {e}")
+        return None
+    finally:
+        conn.close()
+
+def update_user(username, email, password_hash):
     try:
         conn = create_connection()
         cursor = conn.cursor()
-        cursor.execute('DELETE FROM fridge WHERE fridge_id = ?', (fridge_id,))
+        cursor.execute(f'''
+            UPDATE user SET email = ?, password_hash = ?
+            WHERE username = ? AND NOT {_tombstoned_sql('user', 'user.user_id')}
+        ''', (email, password_hash, username))
         if cursor.rowcount == 0:
             return False
         conn.commit()
         return True
     except Error as e:
-        print(f"[delete_fridge] Fehler: {e}")
+        print(f"[update_user] Fehler: {e}")
         return False
     finally:
         conn.close()
 
-def add_product(user_id, name, kategorie, bild_url, einheit, barcode_path):
+def delete_user(username):
+    """Tombstone the user and queue removal of all their data. Returns the deletion job id, or None."""
+    try:
+        conn = create_connection()
+        cursor = conn.cursor()
+        cursor.execute(f'''
+            INSERT INTO deletion_job (entity_type, entity_id)
+            SELECT 'user', user_id FROM user u
+            WHERE username = ? AND NOT {_tombstoned_sql('user', 'u.user_id')}
+        ''', (username,))
+        if cursor.rowcount == 0:
+            return None
+        conn.commit()
+        return cursor.lastrowid
+    except Error as e:
+        print(f"[delete_user] Fehler: {e}")
+        return None
+    finally:
+        conn.close()
+
+# Löschschritte je Entitätstyp, in Reihenfolge. Jeder Schritt entfernt höchstens
+# batch_size Zeilen, damit die Schreibsperre nur kurz gehalten wird.
+DELETION_STEPS = {
+    'fridge': [
+        'DELETE FROM in_fridge WHERE id IN (SELECT id FROM in_fridge WHERE fridge_id = :id LIMIT :batch_size)',
+        'DELETE FROM fridge WHERE fridge_id = :id',
+    ],
+    'user': [
+        '''DELETE FROM in_fridge WHERE id IN (
+               SELECT f.id FROM in_fridge f JOIN fridge fr ON f.fridge_id = fr.fridge_id
+               WHERE fr.user_id = :id LIMIT :batch_size)''',
+        '''DELETE FROM in_fridge WHERE id IN (
+               SELECT f.id FROM in_fridge f JOIN product p ON f.product_id = p.product_id
+               WHERE p.user_id = :id LIMIT :batch_size)''',
+        'DELETE FROM fridge WHERE fridge_id IN (SELECT fridge_id FROM fridge WHERE user_id = :id LIMIT :batch_size)',
+        'DELETE FROM product WHERE product_id IN (SELECT product_id FROM product WHERE user_id = :id LIMIT :batch_size)',
+        'DELETE FROM user WHERE user_id = :id',
+    ],
+}
+
+def get_next_deletion_job():
+    conn = create_connection()
+    cursor = conn.cursor()
+    cursor.execute('''
+        SELECT job_id, entity_type, entity_id FROM deletion_job
+        WHERE status = 'pending' ORDER BY job_id LIMIT 1
+    ''')
+    job = cursor.fetchone()
+    conn.close()
+    return job
+
+def run_deletion_batch(job_id, entity_type, entity_id, batch_size):
+    """Delete one batch of rows for a job in its own transaction. Returns the number of rows deleted."""
+    try:
+        conn = create_connection()
+        cursor = conn.cursor()
+        deleted = 0
+        for step in DELETION_STEPS[entity_type]:
+            cursor.execute(step, {"id": entity_id, "batch_size": batch_size})
+            if cursor.rowcount > 0:
+                deleted = cursor.rowcount
+                break
+        if deleted:
+            cursor.execute('UPDATE deletion_job SET deleted_rows = deleted_rows + ? WHERE job_id = ?',
+                           (deleted, job_id))
+        else:
+            cursor.execute('''
+                UPDATE deletion_job SET status = 'done', finished_at = CURRENT_TIMESTAMP
+                WHERE job_id = ?
+            ''', (job_id,))
+        conn.commit()
+        return deleted
+    except Error as e:
+        print(f"[run_deletion_batch] Fehler: {e}")
+        return None
+    finally:
+        conn.close()
+
+def purge_deletion_jobs(retention_days):
+    """Remove finished deletion jobs older than retention_days. Returns the number removed."""
     try:
         conn = create_connection()
         cursor = conn.cursor()
         cursor.execute('''
+            DELETE FROM deletion_job
+            WHERE status = 'done' AND finished_at < datetime('now', ?)
+        ''', (f'-{retention_days} days',))
+        conn.commit()
+        return cursor.rowcount
+    except Error as e:
+        print(f"[purge_deletion_jobs] Fehler: {e}")
+        return 0
+    finally:
+        conn.close()
+
+def get_deletion_job(job_id):
+    conn = create_connection()
+    cursor = conn.cursor()
+    cursor.execute('SELECT * FROM deletion_job WHERE job_id = ?', (job_id,))
+    job = cursor.fetchone()
+    conn.close()
+    return job
+
+def add_product(user_id, name, kategorie, bild_url, einheit, barcode_path):
+    try:
+        conn = create_connection()
+        cursor = conn.cursor()
+        cursor.execute(f'''
             INSERT INTO product (user_id, name, kategorie, bild_url, einheit, barcode_path)
-            VALUES (?, ?, ?, ?, ?, ?)
-        ''', (user_id, name, kategorie, bild_url, einheit, barcode_path))
+            SELECT ?, ?, ?, ?, ?, ? WHERE {_user_active_sql('?')}
+        ''', (user_id, name, kategorie, bild_url, einheit, barcode_path, user_id))
+        if cursor.rowcount == 0:
+            return False
         conn.commit()
         return True
     except Error as e:
@@ -217,7 +623,9 @@ def add_product(user_id, name, kategorie, bild_url, einheit, barcode_path):
 def get_products_by_user(user_id):
     conn = create_connection()
     cursor = conn.cursor()
-    cursor.execute('SELECT * FROM product WHERE user_id = ?', (user_id,))
+    cursor.execute(f'''
+        SELECT * FROM product p WHERE user_id = ? AND NOT {_tombstoned_sql('user', 'p.user_id')}
+    ''', (user_id,))
     products = cursor.fetchall()
     conn.close()
     return products
@@ -225,7 +633,9 @@ def get_products_by_user(user_id):
 def get_product_by_id(product_id):
     conn = create_connection()
     cursor = conn.cursor()
-    cursor.execute('SELECT * FROM product WHERE product_id = ?', (product_id,))
+    cursor.execute(f'''
+        SELECT * FROM product p WHERE product_id = ? AND NOT {_tombstoned_sql('user', 'p.user_id')}
+    ''', (product_id,))
     product = cursor.fetchone()
     conn.close()
     return product
@@ -234,10 +644,10 @@ def update_product(product_id, name, kategorie, bild_url, einheit, barcode_path)
     try:
         conn = create_connection()
         cursor = conn.cursor()
-        cursor.execute('''
+        cursor.execute(f'''
             UPDATE product
             SET name = ?, kategorie = ?, bild_url = ?, einheit = ?, barcode_path = ?
-            WHERE product_id = ?
+            WHERE product_id = ? AND NOT {_tombstoned_sql('user', 'product.user_id')}
         ''', (name, kategorie, bild_url, einheit, barcode_path, product_id))
         if cursor.rowcount == 0:
             return False
@@ -253,7 +663,9 @@ def delete_product(product_id):
     try:
         conn = create_connection()
         cursor = conn.cursor()
-        cursor.execute('DELETE FROM product WHERE product_id = ?', (product_id,))
+        cursor.execute(f'''
+            DELETE FROM product WHERE product_id = ? AND NOT {_tombstoned_sql('user', 'product.user_id')}
+        ''', (product_id,))
         if cursor.rowcount == 0:
             return False
         conn.commit()
@@ -268,10 +680,12 @@ def store_product_in_fridge(product_id, fridge_id, menge, haltbarkeit, lagerdatu
     try:
         conn = create_connection()
         cursor = conn.cursor()
-        cursor.execute('''
+        cursor.execute(f'''
             INSERT INTO in_fridge (product_id, fridge_id, menge, haltbarkeit, lagerdatum)
-            VALUES (?, ?, ?, ?, ?)
-        ''', (product_id, fridge_id, menge, haltbarkeit, lagerdatum))
+            SELECT ?, ?, ?, ?, ? WHERE {_fridge_visible_sql('?')}
+        ''', (product_id, fridge_id, menge, haltbarkeit, lagerdatum, fridge_id))
+        if cursor.rowcount == 0:
+            return False
         conn.commit()
         return True
     except Error as e:
@@ -284,10 +698,10 @@ def update_fridge_item(entry_id, menge, haltbarkeit, lagerdatum):
     try:
         conn = create_connection()
         cursor = conn.cursor()
-        cursor.execute('''
+        cursor.execute(f'''
             UPDATE in_fridge
             SET menge = ?, haltbarkeit = ?, lagerdatum = ?
-            WHERE id = ?
+            WHERE id = ? AND {_fridge_visible_sql('in_fridge.fridge_id')}
         ''', (menge, haltbarkeit, lagerdatum, entry_id))
         if cursor.rowcount == 0:
             return False
@@ -302,11 +716,11 @@ def update_fridge_item(entry_id, menge, haltbarkeit, lagerdatum):
 def get_contents_of_fridge(fridge_id):
     conn = create_connection()
     cursor = conn.cursor()
-    cursor.execute('''
+    cursor.execute(f'''
         SELECT f.id, p.product_id, p.name, p.kategorie, p.einheit, p.bild_url, f.menge, f.haltbarkeit, f.lagerdatum
         FROM in_fridge f
         JOIN product p ON f.product_id = p.product_id
-        WHERE f.fridge_id = ?
+        WHERE f.fridge_id = ? AND {_fridge_visible_sql('f.fridge_id')}
     ''', (fridge_id,))
     contents = cursor.fetchall()
     conn.close()
@@ -316,7 +730,9 @@ def remove_product_from_fridge(in_fridge_id, fridge_id):
     try:
         conn = create_connection()
         cursor = conn.cursor()
-        cursor.execute('DELETE FROM in_fridge WHERE id = ? AND fridge_id = ?', (in_fridge_id, fridge_id))
+        cursor.execute(f'''
+            DELETE FROM in_fridge WHERE id = ? AND fridge_id = ? AND {_fridge_visible_sql('in_fridge.fridge_id')}
+        ''', (in_fridge_id, fridge_id))
         if cursor.rowcount == 0:
             return False
         conn.commit()
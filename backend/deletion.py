@@ -0,0 +1,87 @@
+"""
+Background deletion of users and fridges.
+Delete requests only tombstone the entity; this worker removes the dependent
+rows in small batches so the SQLite write lock is never held for long.
+"""
+
+import threading
+import time
+from flask import Blueprint, jsonify
+from database import get_next_deletion_job, run_deletion_batch, get_deletion_job, purge_deletion_jobs
+
+BATCH_SIZE = 200
+IDLE_INTERVAL = 5
+# Finished jobs stay queryable for this many days
+JOB_RETENTION_DAYS = 7
+PURGE_INTERVAL = 3600
+
+deletion_bp = Blueprint('deletion_bp', __name__, url_prefix='/deletion_jobs')
+
+_wakeup = threading.Event()
+_worker_lock = threading.Lock()
+_worker_started = False
+
+
+def wake_deletion_worker():
+    _wakeup.set()
+
+
+def _idle():
+    _wakeup.wait(IDLE_INTERVAL)
+    _wakeup.clear()
+
+
+def _run_worker():
+    last_purge = 0
+    while True:
+        try:
+            job = get_next_deletion_job()
+            if job is None:
+                if time.monotonic() - last_purge >= PURGE_INTERVAL:
+                    purge_deletion_jobs(JOB_RETENTION_DAYS)
+                    last_purge = time.monotonic()
+                _idle()
+                continue
+            job_id, entity_type, entity_id = job
+            if run_deletion_batch(job_id, entity_type, entity_id, BATCH_SIZE) is None:
+                # Fehler beim Löschen, später erneut versuchen
+                _idle()
+        except Exception as e:
+            print(f"[deletion_worker] Fehler: {e}")
+            _idle()
+
+
+def ensure_deletion_worker():
+    """Start the background deletion thread once per process."""
+    global _worker_started
+    with _worker_lock:
+        if _worker_started:
+            return
+        _worker_started = True
+    threading.Thread(target=_run_worker, name='deletion-worker', daemon=True).start()
+
+
+def start_deletion_worker(app):
+    """Register the job status endpoint and start the worker with the first request.
+
+    Starting lazily keeps the reloader's parent process, which never serves
+    requests, from running a second worker against the same jobs.
+    """
+    app.register_blueprint(deletion_bp)
+    app.before_request(ensure_deletion_worker)
+
+
+@deletion_bp.route('/<int:job_id>', methods=['GET'])
+def get_deletion_job_route(job_id):
+    job = get_deletion_job(job_id)
+    if job:
+        return jsonify({
+            "job_id": job[0],
+            "entity_type": job[1],
+            "entity_id": job[2],
+            "status": job[3],
+            "deleted_rows": job[4],
+            "created_at": job[5],
+            "finished_at": job[6]
+        }), 200
+    return jsonify({"error": "Deletion job not found."}), 404
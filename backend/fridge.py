@@ -1,10 +1,11 @@
 from flask import Blueprint, request, jsonify, send_file
 from database import (
-    add_fridge, get_fridges_by_user, get_fridge_by_id,
+    add_fridge, get_fridge_summaries_by_user, get_fridge_by_id,
     update_fridge, delete_fridge,
     store_product_in_fridge, get_contents_of_fridge, remove_product_from_fridge,
     update_fridge_item
 )
+from deletion import wake_deletion_worker
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import letter
 from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
@@ -23,13 +24,29 @@ def create_fridge():
     success = add_fridge(data['user_id'], data['title'])
     if success:
         return jsonify({"message": "Fridge created successfully."}), 201
-    return jsonify({"error": "Failed to create fridge."}), 500
+    return jsonify({"error": "User not found or fridge creation failed."}), 404
 
 @fridge_bp.route('/user/<int:user_id>', methods=['GET'])
 def get_fridges(user_id):
-    fridges = get_fridges_by_user(user_id)
+    fridges, stock = get_fridge_summaries_by_user(user_id)
+    stock_by_fridge = {}
+    for s in stock:
+        stock_by_fridge.setdefault(s[0], []).append({
+            "kategorie": s[1],
+            "einheit": s[2],
+            "item_count": s[3],
+            "total_menge": s[4]
+        })
     return jsonify([
-        {"fridge_id": f[0], "user_id": f[1], "title": f[2]} for f in fridges
+        {
+            "fridge_id": f[0],
+            "user_id": f[1],
+            "title": f[2],
+            "item_count": f[3],
+            "total_menge": f[4],
+            "next_expiry": f[5],
+            "stock": stock_by_fridge.get(f[0], [])
+        } for f in fridges
     ]), 200
 
 @fridge_bp.route('/<int:fridge_id>', methods=['GET'])
@@ -52,9 +69,10 @@ def update_fridge_route(fridge_id):
 
 @fridge_bp.route('/<int:fridge_id>', methods=['DELETE'])
 def delete_fridge_route(fridge_id):
-    success = delete_fridge(fridge_id)
-    if success:
-        return jsonify({"message": "Fridge deleted successfully."}), 200
+    job_id = delete_fridge(fridge_id)
+    if job_id:
+        wake_deletion_worker()
+        return jsonify({"message": "Fridge deletion scheduled.", "job_id": job_id}), 202
     return jsonify({"error": "Fridge not found or delete failed."}), 404
 
 @fridge_bp.route('/<int:fridge_id>/store', methods=['POST'])
@@ -72,7 +90,7 @@ def store_product(fridge_id):
     )
     if success:
         return jsonify({"message": "Product stored in fridge."}), 200
-    return jsonify({"error": "Failed to store product."}), 500
+    return jsonify({"error": "Fridge not found or store failed."}), 404
 
 @fridge_bp.route('/update_item/<int:entry_id>', methods=['PUT'])
 def update_fridge_entry(entry_id):
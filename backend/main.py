@@ -6,7 +6,9 @@ Handles application initialization and configuration.
 import os
 from flask import Flask
 from flask_cors import CORS
-from database import initialize_database
+from database import initialize_database, check_fridge_summary
+from admission import init_admission
+from deletion import start_deletion_worker
 
 # Import blueprints
 from user import user_bp
@@ -21,12 +23,25 @@ def create_app():
     CORS(app)
 
     initialize_database()
+    init_admission(app)
 
     app.register_blueprint(user_bp)
     app.register_blueprint(product_bp)
     app.register_blueprint(fridge_bp)
+    start_deletion_worker(app)
     #app.register_blueprint(views_bp)
 
+    @app.cli.command('check-fridge-summary')
+    def check_fridge_summary_command():
+        """Rebuild the fridge summary tables and report stale fridges."""
+        stale = check_fridge_summary()
+        if stale is None:
+            print("Consistency check failed.")
+        elif stale:
+            print(f"Rebuilt stale summaries for fridges: {stale}")
+        else:
+            print("Fridge summary is consistent.")
+
     return app
 
 if __name__ == '__main__':
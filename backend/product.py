@@ -25,7 +25,7 @@ def create_product():
     )
     if success:
         return jsonify({"message": "Product created successfully."}), 201
-    return jsonify({"error": "Failed to create product."}), 500
+    return jsonify({"error": "User not found or product creation failed."}), 404
 
 # Produkte eines Users abrufen (Read All)
 @product_bp.route('/user/<int:user_id>', methods=['GET'])
@@ -1,5 +1,9 @@
 from flask import Blueprint, request, jsonify
-from database import add_user, get_user_by_credentials, get_user_by_id, user_exists_by_email, create_connection
+from database import (
+    add_user, get_user_by_credentials, get_user_by_id, user_exists_by_email,
+    update_user, delete_user
+)
+from deletion import wake_deletion_worker
 
 user_bp = Blueprint('user_bp', __name__, url_prefix='/users')
 
@@ -47,28 +51,17 @@ def read_user_by_id(user_id):
     return jsonify({"error": "User not found."}), 404
 
 @user_bp.route('/<username>', methods=['PUT'])
-def update_user(username):
+def update_user_route(username):
     data = request.json
-    conn = create_connection()
-    cursor = conn.cursor()
-    cursor.execute('''
-        UPDATE user SET email = ?, password_hash = ? WHERE username = ?
-    ''', (data['email'], data['password_hash'], username))
-    if cursor.rowcount == 0:
-        conn.close()
+    success = update_user(username, data['email'], data['password_hash'])
+    if not success:
         return jsonify({"error": "User not found."}), 404
-    conn.commit()
-    conn.close()
     return jsonify({"message": "User updated successfully."}), 200
 
 @user_bp.route('/<username>', methods=['DELETE'])
-def delete_user(username):
-    conn = create_connection()
-    cursor = conn.cursor()
-    cursor.execute('DELETE FROM user WHERE username = ?', (username,))
-    if cursor.rowcount == 0:
-        conn.close()
+def delete_user_route(username):
+    job_id = delete_user(username)
+    if job_id is None:
         return jsonify({"error": "User not found."}), 404
-    conn.commit()
-    conn.close()
-    return jsonify({"message": "User deleted successfully."}), 200
+    wake_deletion_worker()
+    return jsonify({"message": "User deletion scheduled.", "job_id": job_id}), 202